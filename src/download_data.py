@@ -6,7 +6,7 @@ Step 1 — Download & prepare raw play-by-play for the 1997 Finals (Bulls–Jazz
 
 What this script does:
 1) Pulls *playoff* play-by-play for 1996–97 (and optionally 1997–98) directly from a public GitHub dataset.
-2) Writes full-season playoff PBP CSV(s) to data/raw/.
+2) Writes full-season playoff PBP CSV(s) to data/raw/ (all rows, limited to the columns in NEEDED_COLS).
 3) Detects Bulls–Jazz playoff games (i.e., 1997 NBA Finals) and writes a finals-only CSV.
 4) Prints a short sanity report including whether Steve Kerr's made shot appears in Game 6 (1997-06-13).
 
@@ -17,16 +17,31 @@ https://www.basketball-reference.com/boxscores/pbp/199706130CHI.html
 
 from pathlib import Path
 from itertools import product
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import urlopen
 from typing import Union, Sequence, Optional, List
-from io import BytesIO, TextIOWrapper
+from io import TextIOWrapper
 import tarfile
+import shutil
 import csv
 import sys
+import time
 import re
 
+import numpy as np
 import pandas as pd
 
+try:
+    # Multithreaded CSV reader (via pandas) and writer
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_pq
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    pa = None
+    CSV_ENGINE = "c"
+
 # -----------------------------
 # Config
 # -----------------------------
@@ -36,6 +51,41 @@ INCLUDE_9798 = False        # flip to True to also download 1997–98 playoffs
 DATA_TYPES = ("nbastats",)  # we only need NBA Stats pbp here
 SEASON_TYPE = "po"          # 'rg' regular season, 'po' playoffs
 LEAGUE = "nba"
+INDEX_URL = "https://raw.githubusercontent.com/shufinskiy/nba_data/main/list_data.txt"
+INDEX_MAX_AGE_S = 24 * 3600  # re-fetch the cached list_data.txt after a day
+MAX_WORKERS = 8              # archives downloaded/parsed concurrently
+
+TEAM_COL_CANDIDATES = [
+    # typical NBA stats PBP columns
+    "PLAYER1_TEAM_ABBREVIATION",
+    "PLAYER2_TEAM_ABBREVIATION",
+    "PLAYER3_TEAM_ABBREVIATION",
+    "TEAM_ABBREVIATION",
+    "PLAYER1_TEAM_CITY",
+    "PLAYER2_TEAM_CITY",
+    "PLAYER3_TEAM_CITY",
+]
+
+DESC_COLS = ["HOMEDESCRIPTION", "VISITORDESCRIPTION", "NEUTRALDESCRIPTION"]
+
+# Columns kept when parsing archives (this step + the notebooks downstream)
+NEEDED_COLS = [
+    "GAME_ID", "PERIOD", "EVENTNUM", "EVENTMSGTYPE", "EVENTMSGACTIONTYPE",
+    "PCTIMESTRING", "SCORE", "SCOREMARGIN",
+    *DESC_COLS,
+    "PLAYER1_ID", "PLAYER2_ID", "PLAYER3_ID",
+    "PLAYER1_NAME", "PLAYER2_NAME", "PLAYER3_NAME",
+    *TEAM_COL_CANDIDATES,
+]
+
+# Low-cardinality identifier columns stored as pandas categoricals after loading
+CATEGORICAL_COLS = [
+    "GAME_ID",
+    "PLAYER1_TEAM_ABBREVIATION",
+    "PLAYER2_TEAM_ABBREVIATION",
+    "PLAYER3_TEAM_ABBREVIATION",
+    "__archive_name",
+]
 
 
 # fetch paths
@@ -51,6 +101,65 @@ OUT_DIR = Path(config.DATA_RAW_DIR)
 # Minimal loader for shufinskiy/nba_data (Python version)
 # (adapted from the project's README)
 # -----------------------------
+def _read_pbp_csv(f) -> pd.DataFrame:
+    """Parse a PBP CSV stream, keeping only the columns the pipeline uses."""
+    # Read the header ourselves so usecols only lists columns that exist in this archive
+    # utf-8-sig: a BOM would otherwise turn GAME_ID into "\ufeffGAME_ID" and drop it from usecols
+    header = next(csv.reader([f.readline().decode("utf-8-sig")]))
+    keep = [i for i, c in enumerate(header) if c in NEEDED_COLS]
+    df = pd.read_csv(f, engine=CSV_ENGINE, header=None, usecols=keep)
+    df.columns = [header[i] for i in keep]
+    return df
+
+def _download(url: str, dest: Path) -> None:
+    """Stream 'url' to 'dest' (via a .part file, so an interrupted run leaves no bad cache)."""
+    tmp = dest.with_name(dest.name + ".part")
+    with urlopen(url) as response:
+        if response.status != 200:
+            raise RuntimeError(f"Failed to download: {url} (HTTP {response.status})")
+        with tmp.open("wb") as out:
+            shutil.copyfileobj(response, out)
+    tmp.replace(dest)
+
+def _load_archive(
+    path: Path,
+    name: str,
+    url: str,
+    in_memory: bool = True,
+    use_pandas: bool = True,
+    untar: bool = False
+) -> Optional[Union[List, pd.DataFrame]]:
+    """Fetch one archive (from the disk cache if present) and decode it as requested."""
+    # Archives are kept on disk, so re-runs skip the download entirely
+    archive_path = path / f"{name}.tar.xz"
+    if not in_memory and untar and (path / f"{name}.csv").exists():
+        # untar removes the archive after extracting, so the extracted CSV is the cache here
+        return None
+    if not archive_path.exists():
+        _download(url, archive_path)
+
+    if in_memory:
+        # Walk members lazily instead of getmember(), which indexes the whole tar first and then
+        # seeks back (for xz: decompress twice). The CSV is decompressed once, straight into the parser.
+        with tarfile.open(archive_path, mode="r:xz") as tar:
+            csv_name = f"{name}.csv"
+            member = next((m for m in tar if m.name == csv_name), None)
+            if member is None:
+                raise RuntimeError(f"{csv_name} not found in {archive_path}")
+            f = tar.extractfile(member)
+            if use_pandas:
+                df_part = _read_pbp_csv(f)
+                # Attach season key for traceability
+                df_part["__archive_name"] = name
+                return df_part
+            reader = csv.reader(TextIOWrapper(f, encoding="utf-8"))
+            return list(reader)
+    if untar:
+        with tarfile.open(archive_path) as tar:
+            tar.extract(f"{name}.csv", path)
+        archive_path.unlink()
+    return None
+
 def load_nba_data(
     path: Union[Path, str] = Path.cwd(),
     seasons: Union[Sequence, int] = (1996,),
@@ -66,6 +175,7 @@ def load_nba_data(
 
     If in_memory=True & use_pandas=True, returns a concatenated DataFrame.
     Otherwise, saves .tar.xz archives (and optionally extracts CSVs) to 'path'.
+    The index and the archives are cached in 'path' and reused on later runs.
     """
     if isinstance(path, str):
         path = Path(path).expanduser()
@@ -84,114 +194,141 @@ def load_nba_data(
         need_data = [f"{d}_{s}" for d, s in product(data, seasons)]
         need_data += [f"{d}_{seasontype}_{s}" for d, s in product(data, seasons)]
 
-    # Map names -> URLs
-    with urlopen("https://raw.githubusercontent.com/shufinskiy/nba_data/main/list_data.txt") as resp:
-        v = resp.read().decode("utf-8")
+    path.mkdir(parents=True, exist_ok=True)
+
+    # Map names -> URLs (index cached next to the archives)
+    index_path = path / "list_data.txt"
+    if not index_path.exists() or time.time() - index_path.stat().st_mtime > INDEX_MAX_AGE_S:
+        _download(INDEX_URL, index_path)
+    v = index_path.read_text(encoding="utf-8")
     name_v = [line.split("=")[0] for line in v.split("\n") if "=" in line]
     element_v = [line.split("=")[1] for line in v.split("\n") if "=" in line]
 
     need_name = [name for name in name_v if name in need_data]
     need_element = [element for (name, element) in zip(name_v, element_v) if name in need_data]
 
+    # Download + decode archives concurrently (network, xz and pyarrow parsing release the GIL)
+    parts = []
+    if need_name:
+        fetch = partial(_load_archive, path, in_memory=in_memory, use_pandas=use_pandas, untar=untar)
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(need_name))) as ex:
+            parts = list(ex.map(fetch, need_name, need_element))
+
+    # Partial frames are concatenated once, after all archives are in
     if in_memory and use_pandas:
-        table = pd.DataFrame()
+        table = pd.concat(parts, axis=0, ignore_index=True) if parts else pd.DataFrame()
+        # Low-cardinality keys as categoricals: int codes for groupby/isin/eq, far less memory
+        cat_cols = [c for c in CATEGORICAL_COLS if c in table.columns]
+        table[cat_cols] = table[cat_cols].astype("category")
     elif in_memory:
-        table = []
+        table = [row for rows in parts for row in rows]
     else:
         table = None
-
-    path.mkdir(parents=True, exist_ok=True)
-
-    for name, url in zip(need_name, need_element):
-        with urlopen(url) as response:
-            if response.status != 200:
-                raise RuntimeError(f"Failed to download: {url} (HTTP {response.status})")
-            content = response.read()
-
-        if in_memory:
-            with tarfile.open(fileobj=BytesIO(content), mode="r:xz") as tar:
-                csv_name = f"{name}.csv"
-                member = tar.getmember(csv_name)
-                f = tar.extractfile(member)
-                if use_pandas:
-                    df_part = pd.read_csv(f)
-                    # Attach season key for traceability
-                    df_part["__archive_name"] = name
-                    table = pd.concat([table, df_part], axis=0, ignore_index=True)
-                else:
-                    reader = csv.reader(TextIOWrapper(f, encoding="utf-8"))
-                    for row in reader:
-                        table.append(row)
-        else:
-            # Save archive to disk
-            archive_path = path / f"{name}.tar.xz"
-            archive_path.write_bytes(content)
-            if untar:
-                with tarfile.open(archive_path) as tar:
-                    tar.extract(f"{name}.csv", path)
-                archive_path.unlink()
-
     return table
 
 # -----------------------------
 # Helpers to extract teams & finals games
 # -----------------------------
-TEAM_COL_CANDIDATES = [
-    # typical NBA stats PBP columns
-    "PLAYER1_TEAM_ABBREVIATION",
-    "PLAYER2_TEAM_ABBREVIATION",
-    "PLAYER3_TEAM_ABBREVIATION",
-    "TEAM_ABBREVIATION",
-    "PLAYER1_TEAM_CITY",
-    "PLAYER2_TEAM_CITY",
-    "PLAYER3_TEAM_CITY",
-]
-
-DESC_COLS = ["HOMEDESCRIPTION", "VISITORDESCRIPTION", "NEUTRALDESCRIPTION"]
+# Compiled once at import; reused for every game/column scan below
+TEAM_ABBR_RE = re.compile(r"[A-Z]{2,4}")
+TEAM_WORD_RE = re.compile(r"\b(CHI|UTA|UTAH)\b")
+KERR_NAME_RE = re.compile(r"\bSTEVE\s+KERR\b", re.IGNORECASE)
+KERR_DESC_RE = re.compile(r"\bKERR\b.*(?:\bMADE\b|\bMAKES\b|\bJUMPER\b|\b2-?PT\b)", re.IGNORECASE)
+# Kerr as the shooter: PBP descriptions open with the shooter's name (assists come later, "(Kerr 1 AST)")
+KERR_SHOOTER_RE = re.compile(r"^\s*KERR\b", re.IGNORECASE | re.MULTILINE)
+CLOCK_RE = re.compile(r"^\d+:\d{2}$")
+
+def _joined_desc(df: pd.DataFrame, desc_cols: List[str]) -> pd.Series:
+    """All description columns of each row as one string, so a single scan covers them."""
+    # "\n" separator: ".*" in the patterns cannot run from one column into the next
+    first, *rest = [df[c].fillna("").astype(str) for c in desc_cols]
+    return first.str.cat(rest, sep="\n") if rest else first
 
 def collect_team_abbrevs(df: pd.DataFrame) -> pd.Series:
     """Return a Series mapping GAME_ID -> set of team abbrevs seen in that game."""
-    # Gather team abbrevs from explicit columns if present
-    team_sets = {}
+    # Gather team abbrevs from explicit columns if present (one long column, scanned once)
     has_cols = [c for c in TEAM_COL_CANDIDATES if c in df.columns]
-    for gid, g in df.groupby("GAME_ID"):
-        teams = set()
-        for c in has_cols:
-            vals = g[c].dropna().astype(str).str.upper().str.strip()
-            # Keep obvious NBA tricodes (guard against city names)
-            teams.update([v for v in vals if re.fullmatch(r"[A-Z]{2,4}", v)])
-        # Fall back: mine descriptions for "CHI" / "UTA"
-        if not teams:
-            for dcol in [c for c in DESC_COLS if c in df.columns]:
-                txt = " ".join(g[dcol].dropna().astype(str).tolist()).upper()
-                if " CHI " in f" {txt} " or " CHI." in txt or " CHI," in txt:
-                    teams.add("CHI")
-                if " UTA " in f" {txt} " or " UTAH" in txt or " UTA," in txt:
-                    teams.add("UTA")
-        team_sets[gid] = teams
-    return pd.Series(team_sets, name="teams")
+    m = df[["GAME_ID", *has_cols]].melt(id_vars="GAME_ID", value_name="abbr").dropna()
+    m["abbr"] = m["abbr"].astype(str).str.upper().str.strip()
+    # Keep obvious NBA tricodes (guard against city names)
+    m = m[m["abbr"].str.fullmatch(TEAM_ABBR_RE)]
+    team_sets = m.groupby("GAME_ID", observed=True)["abbr"].agg(set).to_dict()
+
+    # Fall back: mine descriptions for "CHI" / "UTA", only for games with no tricodes
+    desc_cols = [c for c in DESC_COLS if c in df.columns]
+    # Fresh positional index: the exploded matches below are mapped back to GAME_ID by label
+    missing = df.loc[~df["GAME_ID"].isin(team_sets.keys()), ["GAME_ID", *desc_cols]].reset_index(drop=True)
+    team_sets.update({gid: set() for gid in missing["GAME_ID"].unique()})
+    if desc_cols:
+        found = _joined_desc(missing, desc_cols).str.upper().str.findall(TEAM_WORD_RE).explode().dropna()
+        found = found.replace("UTAH", "UTA")
+        team_sets.update(found.groupby(missing.loc[found.index, "GAME_ID"].to_numpy()).agg(set).to_dict())
+    return pd.Series(team_sets, name="teams").sort_index()
 
 def finals_game_ids_1997(df: pd.DataFrame) -> List[str]:
     """Identify Bulls–Jazz playoff games in 1996–97 (i.e., the 1997 Finals)."""
+    # Fast path: plain equality on the tricode columns, no per-game team sets
+    has_cols = [c for c in TEAM_COL_CANDIDATES if c in df.columns]
+    if has_cols:
+        teams = df[has_cols]
+        chi_games = set(df.loc[teams.eq("CHI").any(axis=1), "GAME_ID"])
+        uta_games = set(df.loc[teams.eq("UTA").any(axis=1), "GAME_ID"])
+        gids = chi_games & uta_games
+        if gids:
+            return sorted(gids)
+
     team_sets = collect_team_abbrevs(df)
     gids = [gid for gid, teams in team_sets.items() if {"CHI", "UTA"}.issubset(teams)]
     return sorted(gids)
 
+def _kerr_mask(col: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """Mask of cells matching 'pattern'; the regex only runs on cells containing a literal "KERR"."""
+    text = col.astype(str)
+    mask = text.str.contains("KERR", case=False, regex=False)
+    if mask.any():
+        mask[mask] = text[mask].str.contains(pattern)
+    return mask
+
 def find_kerr_make_in_game(df_game: pd.DataFrame) -> Optional[pd.DataFrame]:
-    """Look for a Steve Kerr made shot row in a single-game PBP chunk."""
+    """Look for Steve Kerr made shot rows in a PBP chunk (one game or several)."""
     name_cols = [c for c in df_game.columns if "PLAYER" in c and "NAME" in c]
     desc_cols = [c for c in DESC_COLS if c in df_game.columns]
+
+    found = []
+    rest = df_game
+
+    # EVENTMSGTYPE == 1 is a made field goal: an integer compare replaces the "made" keyword regex
+    if "EVENTMSGTYPE" in df_game.columns:
+        is_made = df_game["EVENTMSGTYPE"] == 1
+        # Chosen per game: games with no made FG in the chunk still go through the regexes below
+        if "GAME_ID" in df_game.columns:
+            game_has_made = is_made.groupby(df_game["GAME_ID"], observed=True).transform("any")
+        else:
+            game_has_made = pd.Series(is_made.any(), index=df_game.index)
+        made = df_game[is_made]
+        rest = df_game[~game_has_made]
+        if not made.empty:
+            # PLAYER1 is the shooter on a made FG (PLAYER2 is the assister)
+            mask = pd.Series(False, index=made.index)
+            if "PLAYER1_NAME" in made.columns:
+                mask |= _kerr_mask(made["PLAYER1_NAME"], KERR_NAME_RE)
+            if desc_cols:
+                # MULTILINE "^" anchors on every description column of the joined string
+                mask |= _kerr_mask(_joined_desc(made, desc_cols), KERR_SHOOTER_RE)
+            if mask.any():
+                found.append(made[mask].sort_values("EVENTNUM"))
+
     candidates = []
 
     # name-based hit
     for nc in name_cols:
-        hits = df_game[df_game[nc].astype(str).str.contains(r"\bSTEVE\s+KERR\b", case=False, na=False)]
+        hits = rest[_kerr_mask(rest[nc], KERR_NAME_RE)]
         if not hits.empty:
             candidates.append(hits)
 
     # description-based hit
-    for dc in desc_cols:
-        hits = df_game[df_game[dc].astype(str).str.contains(r"\bKERR\b.*\bMADE|\bMAKES\b|\bJUMPER\b|\b2-PT\b|\b2PT\b", case=False, na=False)]
+    if desc_cols:
+        hits = rest[_kerr_mask(_joined_desc(rest, desc_cols), KERR_DESC_RE)]
         if not hits.empty:
             candidates.append(hits)
 
@@ -200,8 +337,32 @@ def find_kerr_make_in_game(df_game: pd.DataFrame) -> Optional[pd.DataFrame]:
         # Prefer "made" events if EVENTMSGTYPE present (1 == made shot typically)
         if "EVENTMSGTYPE" in out.columns:
             out = out.sort_values(["EVENTMSGTYPE", "EVENTNUM"])  # EVENTNUM increasing over time
-        return out
-    return None
+        found.append(out)
+
+    return pd.concat(found, axis=0) if found else None
+
+# -----------------------------
+# Output
+# -----------------------------
+def _as_arrow(df: pd.DataFrame):
+    """Convert df once to an Arrow table shared by every output written from it (None without pyarrow)."""
+    return pa.Table.from_pandas(df, preserve_index=False) if pa is not None else None
+
+def _write_outputs(df: pd.DataFrame, tbl, rows, out_csv: Path) -> None:
+    """
+    Write the rows of df at positions 'rows' to out_csv, through the shared Arrow table if any.
+
+    With pyarrow, a zstd Parquet twin (same name, .parquet) is written next to the CSV,
+    so later steps can skip CSV parsing. It keeps the numeric/string dtypes; of the
+    categoricals only the string ones survive the round trip (GAME_ID reads back as
+    int64, an all-null categorical as float64).
+    """
+    if tbl is not None:
+        part = tbl.take(rows)
+        pa_csv.write_csv(part, out_csv)
+        pa_pq.write_table(part, out_csv.with_suffix(".parquet"), compression="zstd")
+    else:
+        df.iloc[rows].to_csv(out_csv, index=False)
 
 # -----------------------------
 # Main
@@ -224,48 +385,65 @@ def main():
     # Basic normalization
     if "GAME_ID" not in df.columns:
         raise RuntimeError("Expected column GAME_ID not found in downloaded data.")
-    # Keep only the columns we'll need later + keep everything raw for now
+    # Columns were already limited to NEEDED_COLS at load time; rows stay raw (all events kept)
     df.sort_values(["GAME_ID", "PERIOD", "EVENTNUM"], inplace=True, ignore_index=True)
 
-    # Save full playoff PBP for each requested season
-    for s in seasons:
-        mask = df["__archive_name"].str.contains(f"_{SEASON_TYPE}_{s}$")
-        df_s = df.loc[mask].copy()
+    # Save full playoff PBP (NEEDED_COLS only) for each requested season
+    # One hash partition on the (categorical) archive name instead of a regex scan per season
+    tbl = _as_arrow(df)
+    by_archive = df.groupby("__archive_name", sort=False, observed=True).indices
+    # Archives of the same season (one per data type) share one output file
+    by_season = {}
+    for name, rows in by_archive.items():
+        s = int(name.rsplit("_", 1)[1])  # e.g. nbastats_po_1996 -> 1996
+        by_season.setdefault(s, []).append(rows)
+    for s, rows in by_season.items():
+        rows = np.sort(np.concatenate(rows))
         out_csv = OUT_DIR / f"pbp_{s}_{s+1}_playoffs.csv"
-        df_s.to_csv(out_csv, index=False)
-        print(f"✔ Saved season playoffs: {out_csv}  (rows={len(df_s):,})")
+        _write_outputs(df, tbl, rows, out_csv)
+        print(f"✔ Saved season playoffs: {out_csv}  (rows={len(rows):,})")
 
     # 1996–97 Finals (Bulls–Jazz) identification
-    df_9697 = df[df["__archive_name"].str.contains(f"_{SEASON_TYPE}_1996$")].copy()
+    # Reuse the archive partition: only 1996–97 rows are scanned from here on
+    season_names = [f"{d}_{SEASON_TYPE}_1996" for d in DATA_TYPES]
+    season_rows = [by_archive[n] for n in season_names if n in by_archive]
+    season_rows = np.sort(np.concatenate(season_rows)) if season_rows else np.array([], dtype=np.intp)
+    df_9697 = df.iloc[season_rows]
     finals_gids = finals_game_ids_1997(df_9697)
     if not finals_gids:
         raise RuntimeError("Couldn’t find Bulls–Jazz playoff games in 1996–97. Check columns/filters.")
 
-    df_finals = df_9697[df_9697["GAME_ID"].isin(finals_gids)].copy()
+    finals_rows = season_rows[df_9697["GAME_ID"].isin(finals_gids).to_numpy()]
+    df_finals = df.iloc[finals_rows]
     out_finals = OUT_DIR / "pbp_1997_finals_chi_uta.csv"
-    df_finals.to_csv(out_finals, index=False)
+    _write_outputs(df, tbl, finals_rows, out_finals)
     print(f"✔ Saved 1997 Finals (CHI–UTA): {out_finals}  (games={len(set(finals_gids))}, rows={len(df_finals):,})")
     print(f"  Detected GAME_IDs: {sorted(set(finals_gids))}")
 
     # Try to spot Steve Kerr's made shot in Game 6
     # He hit the dagger with ~0:25 left in Q4 (Game 6, June 13, 1997).
     # We'll search within the last 2 minutes of Q4 in the CHI home game among the detected Finals games.
-    game6_candidates = []
-    for gid in sorted(set(finals_gids)):
-        g = df_finals[df_finals["GAME_ID"] == gid].copy()
-        # Coerce a simple clock (mm:ss) if present, else skip clock filter
-        if "PCTIMESTRING" in g.columns:
-            # Keep last 2 minutes of regulation
-            g = g[(g["PERIOD"] == 4) & g["PCTIMESTRING"].astype(str).str.match(r"^\d+:\d{2}$")]
-            g["__sec_left"] = g["PCTIMESTRING"].str.split(":").apply(lambda x: int(x[0]) * 60 + int(x[1]))
-            g = g[g["__sec_left"] <= 120]
-        hit = find_kerr_make_in_game(g if not g.empty else df_finals[df_finals["GAME_ID"] == gid])
-        if hit is not None and not hit.empty:
-            hit["__GAME_ID"] = gid
-            game6_candidates.append(hit)
-
-    if game6_candidates:
-        kerr_hits = pd.concat(game6_candidates).drop_duplicates()
+    # One pass over all Finals rows; games are only told apart when sorting the hits
+    window = df_finals
+    # Coerce a simple clock (mm:ss) if present, else skip clock filter
+    if "PCTIMESTRING" in df_finals.columns:
+        # Keep last 2 minutes of regulation; Q4 first, so only those rows get their clock parsed
+        window = df_finals.loc[df_finals["PERIOD"] == 4].copy()
+        if not window.empty:
+            clock = window["PCTIMESTRING"].astype(str)
+            is_clock = clock.str.fullmatch(CLOCK_RE)
+            # Non-clock strings parse as 0:00 and are dropped by is_clock below
+            parts = clock.where(is_clock, "0:00").str.split(":", n=1, expand=True)
+            window["__sec_left"] = parts[0].astype("int32") * 60 + parts[1].astype("int32")
+            window = window.loc[is_clock & (window["__sec_left"] <= 120)]
+        # Games with nothing in that window are searched whole, as before
+        rest = df_finals.loc[~df_finals["GAME_ID"].isin(window["GAME_ID"].unique())]
+        if not rest.empty:
+            window = pd.concat([window, rest])
+    kerr_hits = find_kerr_make_in_game(window)
+
+    if kerr_hits is not None and not kerr_hits.empty:
+        kerr_hits = kerr_hits.assign(__GAME_ID=kerr_hits["GAME_ID"])
         # Prefer the most "late-clock" event if we computed __sec_left
         if "__sec_left" in kerr_hits.columns:
             kerr_hits = kerr_hits.sort_values(["__GAME_ID", "__sec_left", "EVENTNUM"], ascending=[True, True, True])